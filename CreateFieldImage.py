@@ -68,28 +68,29 @@ class CreateFieldImage(Widget):
         filename = "\
 intersectField 100 holesize 0.5 treasure 3.5 holes 120 HexagonalLikePlayer\
     "
-        self.f = open("" + filename, 'r');
-        fieldType = self.f.readline();
-        dimensionsLine = self.f.readline();
-        dimensionsTokens = dimensionsLine.split();
-        biggestSide = int(dimensionsTokens[0]);
-        if int(dimensionsTokens[1]) > biggestSide:
-            biggestSide = int(dimensionsTokens[1]);
-        self.displayFactor = 10 / (biggestSide/100);
-        self.dimensions = self.convertSize(int(dimensionsTokens[0]), int(dimensionsTokens[1]));
-        Window.size = (self.dimensions[0], self.dimensions[1]);
-        Window.clearcolor = (1, 1, 1);
-        Window.top = 50;
-        Window.left = 50;
+        # the field is drawn while the file is open, and it is closed once drawing is done
+        with open("" + filename, 'r') as self.f:
+            fieldType = self.f.readline();
+            dimensionsLine = self.f.readline();
+            dimensionsTokens = dimensionsLine.split();
+            biggestSide = int(dimensionsTokens[0]);
+            if int(dimensionsTokens[1]) > biggestSide:
+                biggestSide = int(dimensionsTokens[1]);
+            self.displayFactor = 10 / (biggestSide/100);
+            self.dimensions = self.convertSize(int(dimensionsTokens[0]), int(dimensionsTokens[1]));
+            Window.size = (self.dimensions[0], self.dimensions[1]);
+            Window.clearcolor = (1, 1, 1);
+            Window.top = 50;
+            Window.left = 50;
         
-        Line(points=[0,0,500, 500]);
-
-        if fieldType.startswith("realworld"):
-            self.displayRealWorldField();
-        elif fieldType.startswith("intersect"):
-            self.displayIntersectField();
-        else:
-            print("error: type of field not recognized");
+            Line(points=[0,0,500, 500]);
+
+            if fieldType.startswith("realworld"):
+                self.displayRealWorldField();
+            elif fieldType.startswith("intersect"):
+                self.displayIntersectField();
+            else:
+                print("error: type of field not recognized");
     
     def displayRealWorldField(self):
         with self.canvas:
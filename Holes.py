@@ -45,6 +45,11 @@
 # output for the real-world artefact distribution treasure also includes the average number of 
 # artefacts found over the runs and average number of holes that found anything.
 
+# The repeats for each number of holes are independent of the other numbers of holes, so they 
+# are run in parallel processes, by default one per CPU. Set numProcesses in 
+# exploreNumberOfHoles() (or doSpecificGridExperiment()) to change this. The results are still 
+# printed in order of number of holes.
+
 # As mentioned above, note that some players dig a slightly different number of holes than the 
 # one supplied to them as the layout algorithm may not work with all numbers of holes. This 
 # actual number of holes is also returned by Player.play() (as well as weather the dig was 
@@ -77,11 +82,17 @@
 import random
 import math
 import sys
-import traceback
 import time
 import csv
+import copy
+import functools
+from concurrent.futures import ProcessPoolExecutor
 from scipy.stats import qmc
 
+# the ratio of row spacing to hole spacing in a hexagonal layout is sqrt(3)/2;
+# the root is taken once here rather than each time a layout is calculated
+SQRT3 = math.sqrt(3);
+
 # a hole on a field
 class Hole:
     def __init__(self, centreX:float, centreY:float, width:float, height:float):
@@ -89,6 +100,8 @@ class Hole:
         self.centreY = centreY;
         self.width = width;
         self.height = height;
+        # set by the Field when the hole is dug: True if the hole found treasure
+        self.foundTreasure = False;
 
 # an abstract field on which holes can be dug. Implementations are responsible
 # for allowing treasure to be placed on the field too.
@@ -255,18 +268,26 @@ class IntersectField(Field):
             print("hole out of y bounds");
         hole = Hole(centreX, centreY, holeSize, holeSize);
         self.holes.append(hole);
-        return self.__intersectsTreasure(hole);
+        # remember the result so print() doesn't have to work it out again
+        hole.foundTreasure = self.__intersectsTreasure(hole);
+        return hole.foundTreasure;
 
     # prints the field data (holes and treasure placement) to a text file.
     # first line is the string "intersect", second line is field dimensions,
     # third line is the string "circularTreasure" or "rectangularTreasure"
     # fourth line is treasure dimensions
     # the following lines are the hole locations and dimensions and whether it uncovers treasure, one line per hole
+    # If no file name is given the data is printed to standard output.
     def print(self, fileName:str = ""):
         if fileName != "":
-            output = open(fileName, 'w');
+            # the file is closed (and so written out) when the with block finishes
+            with open(fileName, 'w') as output:
+                self.__printData(output);
         else:
-            output = sys.stdout;
+            self.__printData(sys.stdout);
+
+    # prints the field data to output, which is an open file
+    def __printData(self, output):
         print("intersect", file=output);
         print(self.width, self.height, file=output);
         if self.__rectangularTreasure == False:
@@ -274,7 +295,7 @@ class IntersectField(Field):
         else:
             print("rectangularTreasure:", self.__treasureCentreX, self.__treasureCentreY, self.__treasureWidth, self.__treasureHeight, file=output);
         for h in self.holes:
-            print("hole:", h.centreX, h.centreY, h.width, h.height, self.__intersectsTreasure(h), file=output);
+            print("hole:", h.centreX, h.centreY, h.width, h.height, h.foundTreasure, file=output);
             
 # This class encapsulates data for locations of individual artefacts, read from a csv file.
 # The file has first line "<ignored>, xcoord, ycoord".
@@ -306,23 +327,31 @@ class RealWorldData:
     # csvFileName is the name of the file specifying the location of artefacts.
     # see class documentation for the expected format
     def __init__(self, csvFileName:str):
-        csvfile = open(csvFileName,'r');
-        lines = csv.DictReader(csvfile, delimiter=',');
         self.__rawArtefacts = [];
         self.minX = -1;
         self.maxX = -1;
         self.minY = -1;
         self.maxY = -1;
-        for row in lines:
-            x = float(row['xcoord']);
-            y = float(row['ycoord']);
-            # keep track of the minimum and maximum x and y coordinates of artefacts
-            self.__setMinX(x);
-            self.__setMaxX(x);
-            self.__setMinY(y);
-            self.__setMaxY(y);
-
-            self.__rawArtefacts.append((x,y));
+        with open(csvFileName,'r') as csvfile:
+            lines = csv.reader(csvfile, delimiter=',');
+            # find the coordinate columns from the first line once, rather than
+            # building a dictionary for every artefact
+            header = next(lines);
+            xColumn = header.index('xcoord');
+            yColumn = header.index('ycoord');
+            for row in lines:
+                # skip blank lines, such as a blank line at the end of the file
+                if not row:
+                    continue;
+                x = float(row[xColumn]);
+                y = float(row[yColumn]);
+                # keep track of the minimum and maximum x and y coordinates of artefacts
+                self.__setMinX(x);
+                self.__setMaxX(x);
+                self.__setMinY(y);
+                self.__setMaxY(y);
+
+                self.__rawArtefacts.append((x,y));
     
         # assume min values are 0
         if math.floor(self.minX) != 0 or math.floor(self.minY) != 0:
@@ -405,14 +434,18 @@ class RealWorldData:
 
         # for each data parcel of interest, examine its list of artefacts and check if it
         # is within the hole
+        # The artefact loop can run hundreds of times per hole for dense data, so the
+        # attributes it uses are looked up once here rather than on every artefact.
         artefactCount = 0;
+        topLeftX = self.topLeftX;
+        topLeftY = self.topLeftY;
+        artefacts = self.__artefacts;
         try:
             for x in range(startX, endX + 1):
                 for y in range(startY, endY + 1):
-                    parcel = self.__artefacts[x][y];
-                    for i in range(len(parcel.artefacts)):
-                        artefactX = self.topLeftX + parcel.artefacts[i][0];
-                        artefactY = self.topLeftY + parcel.artefacts[i][1];
+                    for (parcelX, parcelY) in artefacts[x][y].artefacts:
+                        artefactX = topLeftX + parcelX;
+                        artefactY = topLeftY + parcelY;
                         if left < artefactX and \
                             right > artefactX and \
                             top < artefactY and \
@@ -422,17 +455,25 @@ class RealWorldData:
             #     print("** error");
             return artefactCount;
         except:
+            # print where the error occurred, then let the exception continue so that
+            # the traceback is printed and the program stops with an error status
             print("error:", x, "artefact max:", len(self.__artefacts));
-            print(traceback.print_exc())
-            exit();
+            raise;
     
-    # print out the artefacts in all data parcels to the given file
+    # print out the artefacts in all data parcels to the given file.
+    # There can be thousands of artefacts, so the lines for each data parcel
+    # are written with a single call rather than one print() per artefact.
     def print(self, file):
         for i in range(len(self.__artefacts)):
             for j in range(len(self.__artefacts[i])):
-                for k in range(len(self.__artefacts[i][j].artefacts)):
-                    print("artefact:", self.__artefacts[i][j].artefacts[k][0] + self.topLeftX, self.__artefacts[i][j].artefacts[k][1] + self.topLeftY, file=file);
+                file.writelines("artefact: " + str(a[0] + self.topLeftX) + " " + str(a[1] + self.topLeftY) + "\n" for a in self.__artefacts[i][j].artefacts);
 
+# Returns the RealWorldData for the given file. The result is cached so each file is
+# read at most once per process, however many fields or experiment repeats use it.
+# The same object is returned each time, so it must be copied before it is placed on a Field.
+@functools.lru_cache(maxsize=None)
+def loadRealWorldData(csvFileName:str) -> RealWorldData:
+    return RealWorldData(csvFileName);
 
 # a Field of the given size in which the treasure is defined by data of individual artefacts,
 # encapsulated by a RealWorldData object.
@@ -446,11 +487,12 @@ class RealWorldField(Field):
 
     # Place the treasure defined by individual artefact data.
     # If the data argument is provided, it will be used. If not,
-    # data will be read from the file of the given name.
-    # This is to avoid having to read from the file repeatedly which is time consuming.
+    # data for the file of the given name is obtained from loadRealWorldData(),
+    # which only reads each file once as reading it is time consuming. That data is
+    # shallow copied so this Field has its own placement but shares the artefacts.
     def placeRealWorldTreasure(self, csvFileName:str = "", data:RealWorldData = None):
         if (data == None):
-            self.__data = RealWorldData(csvFileName);
+            self.__data = copy.copy(loadRealWorldData(csvFileName));
         else:
             self.__data = data;
 
@@ -488,7 +530,9 @@ class RealWorldField(Field):
             centreY = self.height - holeSize/2;
         hole = Hole(centreX, centreY, holeSize, holeSize);
         self.__holes.append(hole);
-        return self.__intersectsTreasure(hole);
+        # remember the result so print() doesn't have to count the artefacts again
+        hole.foundTreasure = self.__intersectsTreasure(hole);
+        return hole.foundTreasure;
 
     # returns True if the hole uncovers any artefacts, otherwise False.
     # Also sets self.artefactCount to the number of artefacts uncovered by the hole.
@@ -528,11 +572,18 @@ class RealWorldField(Field):
     # third line is the string "realworldtreasure"
     # fourth line is treasure dimensions (bounding box).
     # the following lines are the hole locations and dimensions and whether it uncovers treasure, one line per hole
+    # If no file name is given the data is printed to standard output.
     def print(self, fileName = ""):
         if fileName != "":
-            output = open(fileName, 'w');
+            # the file is closed (and so written out) when the with block finishes
+            with open(fileName, 'w') as output:
+                self.__printData(output);
         else:
-            output = sys.stdout;
+            # standard output is not closed, so it can still be printed to
+            self.__printData(sys.stdout);
+
+    # prints the field data to output, which is an open file
+    def __printData(self, output):
         print("realworld", file=output);
         print(self.width, self.height, file=output);
         print("realworldtreasure:", self.__data.minX + self.__data.topLeftX, self.__data.minY + self.__data.topLeftY, \
@@ -541,8 +592,7 @@ class RealWorldField(Field):
         # for i in range(len(self.__artefacts)):
         #     print("artefact:", self.__artefacts[i][0], self.__artefacts[i][1], file=output);
         for h in self.__holes:
-            print("hole:", h.centreX, h.centreY, h.width, h.height, self.__intersectsTreasure(h), file=output);
-        output.close();
+            print("hole:", h.centreX, h.centreY, h.width, h.height, h.foundTreasure, file=output);
 
 
 # An archaeologist that places holes in a field according to its layout strategy.
@@ -577,6 +627,9 @@ class StaggeredPlayer(Player):
         found = False;
         self.numHolesSucceed = 0;
         self.artefactCount = 0;
+        # these don't change while the holes are dug, so look them up once
+        digHole = field.digHole;
+        countArtefacts = isinstance(field, RealWorldField);
         for y in range (yHoles):
             # a new row. set the starting x and y positions for the first hole
             pos_x = borderX;
@@ -594,13 +647,13 @@ class StaggeredPlayer(Player):
                         pos_y = borderY + (dY / 2) + dY * y;
                 
                 # dig a hole
-                hit = field.digHole(holeSize, pos_x, pos_y);
+                hit = digHole(holeSize, pos_x, pos_y);
                 # found records whether or not any hole so far has found treasure
                 found = found or hit;
                 if (hit):
                     self.numHolesSucceed += 1;
 
-                    if (isinstance(field, RealWorldField)):
+                    if (countArtefacts):
                         self.artefactCount += field.artefactCount;
                 holesMade += 1;
                 pos_x += dX;
@@ -663,8 +716,9 @@ class HexagonalLikePlayer(StaggeredPlayer):
 
     # perform the quadratic formula calculation
     def quadratic(self, a:float, b:float, c:float) -> float:
-        x1 = (-1 * b + math.sqrt(b**2 - 4 * a * c)) / (2 * a);
-        x2 = (-1 * b - math.sqrt(b**2 - 4 * a * c)) / (2 * a);
+        root = math.sqrt(b**2 - 4 * a * c);
+        x1 = (-1 * b + root) / (2 * a);
+        x2 = (-1 * b - root) / (2 * a);
         if x1 > 0:
             return x1;
         else:
@@ -680,16 +734,16 @@ class HexagonalLikePlayer(StaggeredPlayer):
     def play(self) -> tuple[bool, int]:
         if (self.LRBorder):
             # calculate number of holes in a row according to the hexagonal-like formula
-            numHoles_x = self.quadratic(2 * self.field.height, self.field.height, -1 * math.sqrt(3) * self.numHoles * self.field.width);
+            numHoles_x = self.quadratic(2 * self.field.height, self.field.height, -1 * SQRT3 * self.numHoles * self.field.width);
             if self.staggerY:
                 numHoles_x = self.quadratic(
-                    4 * self.field.height, 2 * self.field.height - math.sqrt(3) * self.field.width, \
-                    -2 * math.sqrt(3) * self.numHoles * self.field.width);
+                    4 * self.field.height, 2 * self.field.height - SQRT3 * self.field.width, \
+                    -2 * SQRT3 * self.numHoles * self.field.width);
         else:
             if self.staggerY:
                 print("stagger with no border not supported");
                 exit();
-            numHoles_x = self.quadratic(2 * self.field.height, -1 * self.field.height, -1 * math.sqrt(3) * self.numHoles * self.field.width);
+            numHoles_x = self.quadratic(2 * self.field.height, -1 * self.field.height, -1 * SQRT3 * self.numHoles * self.field.width);
         
         # calculate number of rows
         numHoles_y = self.numHoles / numHoles_x;
@@ -747,12 +801,12 @@ class HexagonalPlayer(HexagonalLikePlayer):
     # create a hexagonal layout, otherwise False
     def play(self) -> tuple[bool, int]:
         # calculate number of holes in a row according to the hexagonal-like formula
-        numHoles_x = self.quadratic(2 * self.field.height, self.field.height, -1 * math.sqrt(3) * self.numHoles * self.field.width);
+        numHoles_x = self.quadratic(2 * self.field.height, self.field.height, -1 * SQRT3 * self.numHoles * self.field.width);
 
         if self.staggerY:
             numHoles_x = self.quadratic(
-                4 * self.field.height, 2 * self.field.height - math.sqrt(3) * self.field.width, \
-                -2 * math.sqrt(3) * self.numHoles * self.field.width);
+                4 * self.field.height, 2 * self.field.height - SQRT3 * self.field.width, \
+                -2 * SQRT3 * self.numHoles * self.field.width);
         
         # calculate number of rows
         numHoles_y = self.numHoles / numHoles_x;
@@ -766,7 +820,7 @@ class HexagonalPlayer(HexagonalLikePlayer):
             c = self.field.height / (actualNumHoles[1] + 0.5)
         else:
             c = self.field.height / actualNumHoles[1];
-        a = 2 * c / math.sqrt(3);
+        a = 2 * c / SQRT3;
         border_x = (self.field.width - a * ((actualNumHoles[0]) - 0.5)) / 2;
         border_y = c/2;
 
@@ -781,7 +835,7 @@ class HexagonalPlayer(HexagonalLikePlayer):
         if border_x < self.holeSize / 2:
             self.adjust = True;
             a = (self.field.width - self.holeSize) / (actualNumHoles[0] - 0.5)
-            c = (math.sqrt(3) * a) / 2
+            c = (SQRT3 * a) / 2
             border_x = self.holeSize / 2;
             if self.staggerY:
                 border_y = (self.field.height - c * (actualNumHoles[1] - 0.5)) / 2
@@ -830,9 +884,11 @@ class SpecifiedGridPlayer(StaggeredPlayer):
 #
 # If too many holes are asked for (i.e. they don't all fit), play() will never return.
 #
-# For efficiency considerations the field is divided into buckets
-# of length and width one tenth of the field, and holes in each bucket
-# stored in a 2-D list
+# For efficiency considerations the field is divided into buckets and the holes
+# in each bucket stored in a 2-D list. There are about as many buckets as holes, so
+# each bucket holds about one hole, but buckets are at least twice the hole size so
+# that a new hole only needs to be checked against the holes in the (at most four)
+# buckets around it.
 class RandomPlayer(Player):
     # if border is True, holes will not be placed on the edges of the field, but
     # there will be a border of half the expected distance between holes
@@ -840,8 +896,13 @@ class RandomPlayer(Player):
         self.__numHoles = numHoles;
         self.__field = field;
         self.__holeSize = holeSize;
-        self.__numHorizontalParcels = math.ceil(10);
-        self.__numVerticalParcels = math.ceil(10);
+        # number of buckets in each direction, see the class documentation
+        bucketsPerSide = math.ceil(math.sqrt(numHoles));
+        self.__numHorizontalParcels = max(1, min(bucketsPerSide, math.floor(self.__field.width / (2 * holeSize))));
+        self.__numVerticalParcels = max(1, min(bucketsPerSide, math.floor(self.__field.height / (2 * holeSize))));
+        # the dimensions of each bucket. These don't change so are calculated once here
+        self.__bucketWidth = self.__field.width / self.__numHorizontalParcels;
+        self.__bucketHeight = self.__field.height / self.__numVerticalParcels;
         self.__holePositions = [[[] for y in range(self.__numVerticalParcels)] for x in range(self.__numHorizontalParcels)];
         if border and (self.__field.width != self.__field.height):
             print("non square fields not supported");
@@ -853,8 +914,8 @@ class RandomPlayer(Player):
     
     def __intersectsExistingHole(self, newHole:Hole) -> bool:
         # assumes all holes on the field are of self.__holeSize
-        bucketWidth = self.__field.width / 10;
-        bucketHeight = self.__field.height / 10;
+        bucketWidth = self.__bucketWidth;
+        bucketHeight = self.__bucketHeight;
         startXBucket = math.floor((newHole.centreX - self.__holeSize) / bucketWidth);
         startYBucket = math.floor((newHole.centreY - self.__holeSize) / bucketHeight);
         endXBucket = math.floor((newHole.centreX + self.__holeSize) / bucketWidth);
@@ -873,17 +934,14 @@ class RandomPlayer(Player):
         newRX = newHole.centreX + newHole.width/2;
         newTY = newHole.centreY - newHole.height/2;
 
+        halfHoleSize = self.__holeSize/2;
         for xBucket in range(startXBucket, endXBucket + 1):
             for yBucket in range(startYBucket, endYBucket + 1):
-                length = len(self.__holePositions[xBucket][yBucket]);
-                expected = (self.__numHoles / ((self.__field.width / 10) * (self.__field.height / 10)));
-                
-                for i in range(len(self.__holePositions[xBucket][yBucket])):
-                    h = self.__holePositions[xBucket][yBucket][i]
-                    hLX = h[0] - self.__holeSize/2;
-                    hBY = h[1] + self.__holeSize/2;
-                    hRX = h[0] + self.__holeSize/2;
-                    hTY = h[1] - self.__holeSize/2;
+                for h in self.__holePositions[xBucket][yBucket]:
+                    hLX = h[0] - halfHoleSize;
+                    hBY = h[1] + halfHoleSize;
+                    hRX = h[0] + halfHoleSize;
+                    hTY = h[1] - halfHoleSize;
 
                     if newBY > hTY and newTY < hBY and newRX > hLX and newLX < hRX:
                         # check = self.__field.intersectsExistingHole(newHole);
@@ -907,12 +965,10 @@ class RandomPlayer(Player):
             hole = Hole(x, y, self.__holeSize, self.__holeSize);
             if not(self.__intersectsExistingHole(hole)):
                 hit = self.__field.digHole(self.__holeSize, x, y);
-                eachBucketWidth = self.__field.width / 10;
-                eachBucketHeight = self.__field.height / 10;
                 try:
-                    self.__holePositions[math.floor(x/eachBucketWidth)][math.floor(y/eachBucketHeight)].append((x,y));
+                    self.__holePositions[math.floor(x/self.__bucketWidth)][math.floor(y/self.__bucketHeight)].append((x,y));
                 except:
-                    print ("error at x =", x, "eachBucketWidth =", eachBucketWidth, "y =", y);
+                    print ("error at x =", x, "eachBucketWidth =", self.__bucketWidth, "y =", y);
                 found = found or hit;
                 if (hit):
                     self.numHolesSucceed += 1;
@@ -997,6 +1053,33 @@ def testHexagonality() -> None:
     field.print(fileName=fieldFileName);
     calculateHoleDistances(field);
 
+# creates a square Field of the given size with the treasure randomly placed on it, as used
+# by the experiments. If realWorldData is True, the treasure is the real world data
+# in realWorldDataFile. Otherwise the treasure is a "circle" or "rectangle" as given by treasureShape.
+def createField(fieldSize:int, realWorldData:bool, realWorldDataFile:str, treasureShape:str, treasureRadius:float, treasureWidth:float, treasureHeight:float) -> Field:
+    if realWorldData:
+        field = RealWorldField(fieldSize, fieldSize);
+        field.placeRealWorldTreasure(csvFileName=realWorldDataFile);
+    else:
+        field = IntersectField(fieldSize, fieldSize);
+        if treasureShape == "circle":
+            field.placeCircularTreasure(treasureRadius);
+        else:
+            field.placeRectangularTreasure(treasureWidth, treasureHeight);
+    return field;
+
+# Yields the results of the given futures in order, waiting for each one to finish.
+# If one of them raised an exception, or the wait is interrupted, the work still queued
+# on the executor is cancelled before the exception is raised again, so an error is
+# reported as soon as it is found rather than after all the remaining work has run.
+def resultsInOrder(executor:ProcessPoolExecutor, futures:list):
+    try:
+        for future in futures:
+            yield future.result();
+    except BaseException:
+        executor.shutdown(wait=False, cancel_futures=True);
+        raise;
+
 def printField(field:Field, realWorldData:bool, treasureShape:str, fieldSize:int, holeSize:float, treasureRadius:float, treasureWidth:float, treasureHeight:float, holesDug:int, playerClass:str):
     if realWorldData:
         filename = "realWorldField " + str(fieldSize) + " holesize " + str(holeSize) + " holes " + str(holesDug) + " " + playerClass;
@@ -1013,7 +1096,7 @@ def doSpecificGridExperiment() -> None:
 
     #==================================================================================
     # Change these variable values to specify an experiment.
-    # Also change the subclass of Player that is created later in the function
+    # Also change the subclass of Player that is created in runSpecificGridRepeats()
     # (search "player creation").
     # To decide when to print out the field during the simulation
     # search "print field decision".
@@ -1046,6 +1129,10 @@ def doSpecificGridExperiment() -> None:
     # when treaure is a rectangle, these are the dimensions
     treasureWidth = 20;
     treasureHeight = 5;
+
+    # the number of processes used to run the entries of the parameter list at the same time.
+    # None uses one process per CPU.
+    numProcesses = None;
     #==================================================================================
 
     # determine the number of iterations
@@ -1054,60 +1141,21 @@ def doSpecificGridExperiment() -> None:
     else:
         length = len(numParameters);
 
-    for i in range(length):
-        # on the first iteration, print the experiment data
-        if (i == 0 and realWorldData):
-            if isXyParameters:
-                print("real world, field size:", fieldSize, "hole size:", holeSize, "staggerY:", staggerY);
-            else:
-                print("real world, field size:", fieldSize, "hole size:", holeSize, "staggerY:", staggerY);
-        elif i==0:
-            # using a treasure shape
-            if treasureShape == "circle":
-                print("circle, field:", fieldSize, "hole size:", holeSize, "treasure radius:", treasureRadius, "staggerY:", staggerY);
-            else:
-                # treasure is rectangle
-                print("rectangle, field:", fieldSize, "hole size:", holeSize, "treasure dimensions:", str(treasureWidth) + "x" + str(treasureHeight), "staggerY:", staggerY);
-
-        successes = 0;
-        realWorldDataCache = None;
-        artefactCount = 0;
-        numHolesSucceed = 0;
-        for repeats in range(numRepeats):
-            if (realWorldData):
-                field = RealWorldField(fieldSize, fieldSize);
-                if (realWorldDataCache == None):
-                    field.placeRealWorldTreasure(csvFileName=realWorldDataFile);
-                    realWorldDataCache = field.getData();
-                else:
-                    field.placeRealWorldTreasure(data=realWorldDataCache);
-            else:
-                field = IntersectField(fieldSize, fieldSize);
-                if treasureShape == "circle":
-                    field.placeCircularTreasure(treasureRadius);
-                else:
-                    field.placeRectangularTreasure(treasureWidth, treasureHeight);
-        
-            # player creation: specify the Player to use
-            # for number of holes specified by the xyParameters list use SpecifiedGridPlayer
-            # instead of HexagonalLikePlayer
-            player = SpecifiedGridPlayer(field, holeSize, xyParameters[i][0], xyParameters[i][1], staggerY);
-            #player = RandomPlayer(field, holeSize, numParameters[i], True);
-            #player = HaltonPlayer(field, holeSize, numParameters[i], True);
-            #player = HexagonalLikePlayer(field, holeSize, numParameters[i], True, staggerY);
-            #player = HexagonalPlayer(field, holeSize, numParameters[i], staggerY);
-
-            if i == 0 and repeats == 0:
-                # on the first iteration, print the player class name
-                print(player.__class__.__name__);
-            result = player.play();
-            holesDug = result[1];
-
-            if repeats == 0 and (isinstance(player, HexagonalPlayer) or isinstance(player, HexagonalLikePlayer)\
-                or isinstance(player, SpecifiedGridPlayer)):
-                if player.layoutError:
-                    print("layout algorithm error: probably too many holes for the field size");
-            
+    # print the experiment data
+    if realWorldData:
+        print("real world, field size:", fieldSize, "hole size:", holeSize, "staggerY:", staggerY);
+    elif treasureShape == "circle":
+        print("circle, field:", fieldSize, "hole size:", holeSize, "treasure radius:", treasureRadius, "staggerY:", staggerY);
+    else:
+        # treasure is rectangle
+        print("rectangle, field:", fieldSize, "hole size:", holeSize, "treasure dimensions:", str(treasureWidth) + "x" + str(treasureHeight), "staggerY:", staggerY);
+
+    # The entries of the parameter list are independent of each other, so each one is run
+    # in its own process. Each process reseeds its random number generator so that the
+    # processes don't all place the treasure in the same sequence of positions.
+    with ProcessPoolExecutor(max_workers=numProcesses, initializer=random.seed) as executor:
+        futures = [];
+        for i in range(length):
             # print field decision: set when to print the field out to a file.
             # Can be set to final number of holes, or to False, and then
             # specify numbers of holes
@@ -1117,24 +1165,70 @@ def doSpecificGridExperiment() -> None:
             #     #doPrint = (xyParameters[i][0] == 4 and xyParameters[i][1] == 6);
             # else:
             #     doPrint  = numParameters[i] == 18;
-            if repeats == 0 and doPrint:
-                printField(field, realWorldData, treasureShape, fieldSize, holeSize, treasureRadius, treasureWidth, treasureHeight, holesDug, player.__class__.__name__);
-                
-            if result[0]:
-                successes += 1;
-                if (realWorldData):
-                    artefactCount += player.artefactCount;
-                    numHolesSucceed += player.numHolesSucceed;
-
-        # if isXyParameters:
-        #     numHoles = xyParameters[i][0] * xyParameters[i][1];
-        # else:  
-        #     numHoles = numParameters[i];
-        # print the collected results for this iteration of i (this number of holes)
-        if (realWorldData):
-            print(holesDug, successes * 100 / numRepeats, artefactCount / numRepeats, numHolesSucceed / numRepeats);
-        else:
-            print(holesDug, successes * 100 / numRepeats);
+            futures.append(executor.submit(runSpecificGridRepeats, i, numRepeats, fieldSize, holeSize, xyParameters, numParameters, staggerY, \
+                realWorldData, realWorldDataFile, treasureShape, treasureRadius, treasureWidth, treasureHeight, doPrint));
+
+        # print the results in the order of the parameter list. An exception in any
+        # process stops the experiment, see resultsInOrder().
+        results = resultsInOrder(executor, futures);
+        for i in range(length):
+            (playerClass, layoutError, holesDug, successes, artefactCount, numHolesSucceed) = next(results);
+            if i == 0:
+                # on the first iteration, print the player class name
+                print(playerClass);
+            if layoutError:
+                print("layout algorithm error: probably too many holes for the field size");
+
+            # if isXyParameters:
+            #     numHoles = xyParameters[i][0] * xyParameters[i][1];
+            # else:
+            #     numHoles = numParameters[i];
+            # print the collected results for this iteration of i (this number of holes)
+            if (realWorldData):
+                print(holesDug, successes * 100 / numRepeats, artefactCount / numRepeats, numHolesSucceed / numRepeats);
+            else:
+                print(holesDug, successes * 100 / numRepeats);
+
+# Runs the repeats of doSpecificGridExperiment() for entry i of the parameter lists.
+# This is a separate function so that it can be run in its own process.
+# Returns the class name of the Player, whether the Player had a layout error,
+# the number of holes dug, the number of successful digs, and for real world data the
+# total number of artefacts found and total number of holes that found anything.
+def runSpecificGridRepeats(i:int, numRepeats:int, fieldSize:int, holeSize:float, xyParameters:list, numParameters:list, staggerY:bool, \
+        realWorldData:bool, realWorldDataFile:str, treasureShape:str, treasureRadius:float, treasureWidth:float, treasureHeight:float, \
+        doPrint:bool) -> tuple[str, bool, int, int, int, int]:
+    successes = 0;
+    artefactCount = 0;
+    numHolesSucceed = 0;
+    layoutError = False;
+    for repeats in range(numRepeats):
+        field = createField(fieldSize, realWorldData, realWorldDataFile, treasureShape, treasureRadius, treasureWidth, treasureHeight);
+
+        # player creation: specify the Player to use
+        # for number of holes specified by the xyParameters list use SpecifiedGridPlayer
+        # instead of HexagonalLikePlayer
+        player = SpecifiedGridPlayer(field, holeSize, xyParameters[i][0], xyParameters[i][1], staggerY);
+        #player = RandomPlayer(field, holeSize, numParameters[i], True);
+        #player = HaltonPlayer(field, holeSize, numParameters[i], True);
+        #player = HexagonalLikePlayer(field, holeSize, numParameters[i], True, staggerY);
+        #player = HexagonalPlayer(field, holeSize, numParameters[i], staggerY);
+
+        result = player.play();
+        holesDug = result[1];
+
+        if repeats == 0 and (isinstance(player, HexagonalPlayer) or isinstance(player, HexagonalLikePlayer)\
+            or isinstance(player, SpecifiedGridPlayer)):
+            layoutError = player.layoutError;
+
+        if repeats == 0 and doPrint:
+            printField(field, realWorldData, treasureShape, fieldSize, holeSize, treasureRadius, treasureWidth, treasureHeight, holesDug, player.__class__.__name__);
+
+        if result[0]:
+            successes += 1;
+            if (realWorldData):
+                artefactCount += player.artefactCount;
+                numHolesSucceed += player.numHolesSucceed;
+    return player.__class__.__name__, layoutError, holesDug, successes, artefactCount, numHolesSucceed;
 
 
 # Do experiments over range of hole numbers.
@@ -1143,11 +1237,11 @@ def doSpecificGridExperiment() -> None:
 def exploreNumberOfHoles() -> None:
     #=====================================================================================
     # Change these variable values to specify an experiment.
-    # Also change the subclass of Player that is created later in the function
+    # Also change the subclass of Player that is created in createExplorePlayer()
     # (search "player creation").
     # To print out the field at a certain point during the simulation
     # (when a certain number of holes are dug) change the value to which holesDug is
-    # compared still later in the function (search "print field decision").
+    # compared in runExploreRepeats() (search "print field decision").
 
     fieldSize = 100; # values of 100 and 200 were used in the article
     holeSize = 0.5; # values of 0.5 and 1 are used in the article
@@ -1174,6 +1268,10 @@ def exploreNumberOfHoles() -> None:
     # stagger in the Y direction as well as the X. Some Players are already staggered in the X direction
     # Note that for experiments reported in the article staggerY was always False.
     staggerY = False;
+
+    # the number of processes used to run the repeats for different numbers of holes at the
+    # same time. None uses one process per CPU.
+    numProcesses = None;
     #=====================================================================================
 
     if realWorldData:
@@ -1187,108 +1285,119 @@ def exploreNumberOfHoles() -> None:
     # As this is before any value of "holes" we set to -1
     lastHole = -1;
 
-    # this is where we cache the real world data to avoid having to read the data file on each iteration
-    realWorldDataCache = None;
+    # the values of "holes" that give a new layout, which are the ones we run the repeats for
+    newHoles = [];
 
     # iterate over number of holes. "holes" is the desired number of holes passed to the
-    # Player. The actual number the Player digs may vary according to its layout algorithm
+    # Player. The actual number the Player digs may vary according to its layout algorithm.
+    # Keep track of whether this layout is new: some Players such as HexagonalLikePlayer
+    # will use the same actual number of holes (and layout) for several consecutive desired number of holes.
+    # One dig is enough to find the actual number of holes, and if we find that the layout is
+    # not new we skip the repeats for that value of "holes".
     for holes in range(1, maxHoles+1, holeIncrement):
-        successes = 0;
-        holesDug = -1;
-
-        # Keep track of whether this layout is new: some Players such as HexagonalLikePlayer
-        # will use the same actual number of holes (and layout) for several consecutive desired number of holes.
-        # If we find that the layout is not new we skip the repeats for that value of "holes".
-        new = True;
-
-        artefactCount = 0;
-        numHolesSucceed = 0;
-
-        # run many tests for this number of "holes"
-        for repeats in range(0, numRepeats):
-            if realWorldData:
-                field = RealWorldField(fieldSize, fieldSize);
-                # cache the real world data to avoid reading from the file every time.
-                # The data doesn't change throughout this function.
-                if realWorldDataCache == None:
-                    field.placeRealWorldTreasure(csvFileName=realWorldDataFile);
-                    realWorldDataCache = field.getData();
-                else:
-                    field.placeRealWorldTreasure(data = realWorldDataCache);
-            else:
-                field = IntersectField(fieldSize, fieldSize);
-                if treasureShape == "circle":
-                    field.placeCircularTreasure(treasureRadius);
-                else:
-                    field.placeRectangularTreasure(treasureWidth, treasureHeight);
-
-            # player creation: change the player here
-            player = HexagonalLikePlayer(field, holeSize, holes, LRBorder, staggerY);
-            #player = HexagonalPlayer(field, holeSize, holes, staggerY);
-            #player = HaltonPlayer(field, holeSize, holes, LRBorder);
-            #player = NonStaggeredPlayer(field, holeSize, holes);
-            #player = RandomPlayer(field, holeSize, holes, LRBorder);
-
-            # print class of Player on first iteration
-            if (holes==1 and repeats == 0):
-                print ("class:", player.__class__);
-            
-            if not(new):
-                # we have seen this same layout from the player for a previous value of "holes",
-                # skip the repeats for this value
-                break;
-            
-            try:
-                result = player.play();
-
-                # Check for layout errors, usually because the desired layout with the given holeSize won't fit on the field.
-                # Use repeats == 1 as it weans out the "not new" number of holes
-                if repeats == 1 and (isinstance(player, HexagonalPlayer) or isinstance(player, HexagonalLikePlayer)):
-                    if player.layoutError:
-                        print("layout algorithm error: probably too many holes for the field size");
-                    # d = calculateHoleDistances(field, False);
-                    # if abs(d[0] - d[1]) > 0.0001:
-                    #     print("not hexagonal");  
-                    #     calculateHoleDistances(field, True);
-                if result[0]:
-                    # the player uncovered treasure
-                    successes += 1;
-                    if (realWorldData):
-                        artefactCount += player.artefactCount;
-                        numHolesSucceed += player.numHolesSucceed;
-                
-                if holesDug == -1:
-                    # this is the first repeat for this value of "holes"
-                    holesDug = result[1];
-                elif holesDug != result[1]:
-                    # sanity check that this repeat resulted in the same number of holes being dug
-                    # as the previous repeat. We assume all Players obey this.
-                    print("ERROR: layout algorithm returned inconsistent number of holes dug");
-                    exit();
-                
-                # print field decision: optionally print the field. Change the value that holesDug is compared to as needed
-                if (holesDug == 132) and repeats == 1:
-                    printField(field, realWorldData, treasureShape, fieldSize, holeSize, treasureRadius, treasureWidth, treasureHeight, holesDug, player.__class__.__name__);
-                
-                # check if this layout is new on the first repeat
-                if repeats == 0:
-                    if lastHole == holesDug:
-                        # we have seen this layout for the previous value of "holes"
-                        new = False;
-                    lastHole = holesDug;
-            except:
-                print("ERROR");
-                traceback.print_exc();
-                exit();
-
-        if new:
+        field = createField(fieldSize, realWorldData, realWorldDataFile, treasureShape, treasureRadius, treasureWidth, treasureHeight);
+        player = createExplorePlayer(field, holeSize, holes, LRBorder, staggerY);
+
+        # print class of Player on first iteration
+        if holes == 1:
+            print ("class:", player.__class__);
+
+        holesDug = player.play()[1];
+        if lastHole != holesDug:
+            newHoles.append(holes);
+        lastHole = holesDug;
+
+    # The repeats for each new layout are independent of each other, so each one is run
+    # in its own process. Each process reseeds its random number generator so that the
+    # processes don't all place the treasure in the same sequence of positions.
+    with ProcessPoolExecutor(max_workers=numProcesses, initializer=random.seed) as executor:
+        futures = [];
+        for holes in newHoles:
+            futures.append(executor.submit(runExploreRepeats, holes, numRepeats, fieldSize, holeSize, LRBorder, staggerY, \
+                realWorldData, realWorldDataFile, treasureShape, treasureRadius, treasureWidth, treasureHeight));
+
+        # print the results in order of number of holes. An exception in any process,
+        # including exit() on inconsistent holes, stops the experiment, see resultsInOrder().
+        results = resultsInOrder(executor, futures);
+        for i in range(len(newHoles)):
+            holes = newHoles[i];
+            (layoutError, holesDug, successes, artefactCount, numHolesSucceed) = next(results);
+            if layoutError:
+                print("layout algorithm error: probably too many holes for the field size");
             if (realWorldData):
                 print (holes, holesDug, successes * 100 / numRepeats, artefactCount / numRepeats, numHolesSucceed / numRepeats);
             else:
                 print (holes, holesDug, successes * 100 / numRepeats);
 
-# choose what experiment you want to run
-exploreNumberOfHoles();
-#doSpecificGridExperiment();
-#testHexagonality();
+# creates the Player used by exploreNumberOfHoles() to dig the given number of holes on the field
+def createExplorePlayer(field:Field, holeSize:float, holes:int, LRBorder:bool, staggerY:bool) -> Player:
+    # player creation: change the player here
+    player = HexagonalLikePlayer(field, holeSize, holes, LRBorder, staggerY);
+    #player = HexagonalPlayer(field, holeSize, holes, staggerY);
+    #player = HaltonPlayer(field, holeSize, holes, LRBorder);
+    #player = NonStaggeredPlayer(field, holeSize, holes);
+    #player = RandomPlayer(field, holeSize, holes, LRBorder);
+    return player;
+
+# Runs the repeats of exploreNumberOfHoles() for the given desired number of holes.
+# This is a separate function so that it can be run in its own process.
+# Returns whether the Player had a layout error, the number of holes dug, the number of
+# successful digs, and for real world data the total number of artefacts found and total
+# number of holes that found anything.
+def runExploreRepeats(holes:int, numRepeats:int, fieldSize:int, holeSize:float, LRBorder:bool, staggerY:bool, \
+        realWorldData:bool, realWorldDataFile:str, treasureShape:str, treasureRadius:float, treasureWidth:float, treasureHeight:float) \
+        -> tuple[bool, int, int, int, int]:
+    successes = 0;
+    holesDug = -1;
+    layoutError = False;
+    artefactCount = 0;
+    numHolesSucceed = 0;
+
+    # run many tests for this number of "holes"
+    for repeats in range(0, numRepeats):
+        field = createField(fieldSize, realWorldData, realWorldDataFile, treasureShape, treasureRadius, treasureWidth, treasureHeight);
+        player = createExplorePlayer(field, holeSize, holes, LRBorder, staggerY);
+
+        # any exception is left to propagate, which prints the traceback and
+        # stops the program with an error status
+        result = player.play();
+
+        # Check for layout errors, usually because the desired layout with the given holeSize won't fit on the field.
+        if repeats == 0 and (isinstance(player, HexagonalPlayer) or isinstance(player, HexagonalLikePlayer)):
+            layoutError = player.layoutError;
+            # d = calculateHoleDistances(field, False);
+            # if abs(d[0] - d[1]) > 0.0001:
+            #     print("not hexagonal");  
+            #     calculateHoleDistances(field, True);
+        if result[0]:
+            # the player uncovered treasure
+            successes += 1;
+            if (realWorldData):
+                artefactCount += player.artefactCount;
+                numHolesSucceed += player.numHolesSucceed;
+        
+        if holesDug == -1:
+            # this is the first repeat for this value of "holes"
+            holesDug = result[1];
+        elif holesDug != result[1]:
+            # sanity check that this repeat resulted in the same number of holes being dug
+            # as the previous repeat. We assume all Players obey this.
+            print("ERROR: layout algorithm returned inconsistent number of holes dug");
+            exit(1);
+        
+        # print field decision: optionally print the field. Change the value that holesDug is compared to as needed
+        if (holesDug == 132) and repeats == 0:
+            printField(field, realWorldData, treasureShape, fieldSize, holeSize, treasureRadius, treasureWidth, treasureHeight, holesDug, player.__class__.__name__);
+    return layoutError, holesDug, successes, artefactCount, numHolesSucceed;
+
+# choose what experiment you want to run.
+# The experiments use multiple processes, which import this file, so the experiment
+# is only run when this file is run directly.
+# The time taken is printed to standard error so it doesn't mix with the results.
+if __name__ == '__main__':
+    startTime = time.perf_counter();
+    exploreNumberOfHoles();
+    #doSpecificGridExperiment();
+    #testHexagonality();
+    print("time taken:", round(time.perf_counter() - startTime, 1), "seconds", file=sys.stderr);
 